@@ -14,17 +14,82 @@
 # - Dezimal-Komma wird akzeptiert ("," wird zu ".")
 # ===================================================================
 
+import operator
+import time
 import tkinter as tk
+from functools import partial
+from tkinter import font as tkfont
+
+# tk.END einmalig auflösen (wird von clear() bei jedem Aufruf gebraucht)
+_END = tk.END
+
+# Operator-Tabelle: Zeichen -> Rechenfunktion.
+# Ein Dictionary-Zugriff ersetzt die if/elif-Kette in calculate().
+_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
 
 
 # ===================================================================
 # Funktionen
 # ===================================================================
 
+def _parse_number(text: str) -> float:
+    """
+    Wandelt den Text eines Eingabefeldes in eine Zahl um.
+
+    Ein Dezimal-Komma ("3,14") wird als Dezimal-Punkt interpretiert.
+    Bei ungültigem Text wird (wie bei float()) ein ValueError ausgelöst.
+    """
+    # Nur ersetzen, wenn überhaupt ein Komma vorkommt -> spart im Normalfall
+    # (Eingabe mit Punkt oder ganze Zahl) die zusätzliche String-Kopie.
+    if "," in text:
+        text = text.replace(",", ".")
+    return float(text)
+
+
+def _compute(a: float, b: float, op: str) -> float:
+    """
+    Reiner Rechenkern: wendet den Operator 'op' auf a und b an.
+
+    Kennt keine Widgets, kein Tkinter und keine Anzeigetexte -> nur Zahlen
+    rein, Zahl raus. Ein unbekannter Operator löst einen KeyError aus,
+    eine Division durch 0 einen ZeroDivisionError.
+    """
+    return _OPS[op](a, b)
+
+
+# Zuletzt angezeigter Wert der Ergebnisanzeige (Startzustand: leer)
+_last_result = ""
+
+
+def _update_result(value: str) -> None:
+    """
+    Schreibt 'value' in die Ergebnisanzeige, aber nur wenn sich der Wert
+    geändert hat.
+
+    Jedes Setzen des Label-Textes stößt ein Neuzeichnen des Labels an. Wird z.B.
+    Enter gedrückt gehalten, kommt meist immer wieder dasselbe Ergebnis
+    heraus -> diese unnötigen Schreibzugriffe werden hier übersprungen.
+    Das Neuzeichnen selbst sammelt Tk ohnehin gebündelt in der Idle-Phase.
+
+    'value' ist der fertige Anzeigetext (keine Zahl): Beim Vergleich von
+    Zahlen wäre -0.0 == 0.0 "gleich" und "-0.0" würde nie angezeigt.
+    """
+    global _last_result
+    if value == _last_result:
+        return
+    _last_result = value
+    _set_result(text=value)
+
+
 def calculate(op: str) -> None:
     """
     Führt eine Berechnung basierend auf dem Operator 'op' aus und schreibt
-    das Ergebnis in die Tkinter-Variable 'result'.
+    das Ergebnis in die Ergebnisanzeige 'result_label'.
 
     Parameter
     ---------
@@ -40,32 +105,47 @@ def calculate(op: str) -> None:
     - Ungültige Eingaben (z.B. Buchstaben): Ergebnis = "Ungültige Eingabe"
     - Division durch 0: Ergebnis = "Fehler: ÷0"
     """
+    # Texte aus den Eingabefeldern holen
+    sa = _get_a()
+    sb = _get_b()
+
+    # Häufigster Fehlerfall (leeres Feld, z.B. Enter ohne Eingabe) direkt
+    # abfangen, ohne den Umweg über eine ValueError-Exception.
+    if not sa or not sb:
+        _update_result("Ungültige Eingabe")
+        _ensure_clear_btn()
+        return
+
     try:
-        # Werte aus den Eingabefeldern holen.
-        # replace(",", ".") erlaubt Eingaben wie "3,14" (deutsches Komma).
-        a = float(entry_a.get().replace(",", "."))
-        b = float(entry_b.get().replace(",", "."))
+        # Werte in Zahlen umwandeln.
+        # _parse_number erlaubt Eingaben wie "3,14" (deutsches Komma).
+        # Die Typangaben (float) erlauben z.B. Cython, a und b als C-double
+        # zu behandeln, falls das Modul einmal kompiliert wird.
+        a: float = _parse_number(sa)
+        b: float = _parse_number(sb)
 
         # Operator auswerten und Ergebnis berechnen
-        if op == "+":
-            res = a + b
-        elif op == "-":
-            res = a - b
-        elif op == "*":
-            res = a * b
-        elif op == "/":
-            # Division: Sonderfall b == 0 abfangen
-            res = "Fehler: ÷0" if b == 0 else a / b
+        # Kein eigener Test auf b == 0: der (seltene) Fehlerfall kommt als
+        # ZeroDivisionError, der Normalfall spart sich den Vergleich.
+        res = _compute(a, b, op)
+
+        # Ergebnis (res) als Text in die Ergebnisanzeige schreiben:
+        # repr(float) liefert die kürzeste eindeutige Darstellung, Tcl muss
+        # den Wert nicht mehr umwandeln.
+        _update_result(repr(res))
+
+    except KeyError:
+        # Falls aus irgendeinem Grund ein unbekannter Operator ankommt
+        _update_result("Unbekannter Operator")
+
+    except (ValueError, ZeroDivisionError) as e:
+        if isinstance(e, ZeroDivisionError):
+            # Division durch 0
+            _update_result("Fehler: ÷0")
         else:
-            # Falls aus irgendeinem Grund ein unbekannter Operator ankommt
-            res = "Unbekannter Operator"
-
-        # Ergebnis (res) in die StringVar schreiben -> Label aktualisiert sich automatisch
-        result.set(res)
-
-    except ValueError:
-        # Wird ausgelöst, wenn float(...) nicht klappt (z.B. leeres Feld oder Text)
-        result.set("Ungültige Eingabe")
+            # float(...) hat nicht geklappt (z.B. Text statt Zahl)
+            _update_result("Ungültige Eingabe")
+            _ensure_clear_btn()
 
 
 def clear() -> None:
@@ -73,9 +153,9 @@ def clear() -> None:
     Löscht beide Eingabefelder und das Ergebnisfeld.
     Setzt den Fokus wieder auf das erste Eingabefeld.
     """
-    entry_a.delete(0, tk.END)   # Inhalt von entry_a komplett löschen
-    entry_b.delete(0, tk.END)   # Inhalt von entry_b komplett löschen
-    result.set("")              # Ergebnisanzeige leeren
+    _delete_a(0, _END)          # Inhalt von entry_a komplett löschen
+    _delete_b(0, _END)          # Inhalt von entry_b komplett löschen
+    _update_result("")          # Ergebnisanzeige leeren
     entry_a.focus_set()         # Cursor/Fokus zurück in entry_a
 
 
@@ -84,6 +164,7 @@ def clear() -> None:
 # ===================================================================
 
 root = tk.Tk()                      # Root-Fenster erzeugen
+root.withdraw()                     # erst unsichtbar aufbauen, am Ende einmal anzeigen
 root.title("Mini-Rechner")          # Titel in der Fensterleiste
 root.resizable(False, False)        # Fenstergröße fixieren (kein Ziehen/Resizing)
 
@@ -109,12 +190,13 @@ frame.grid(row=0, column=0)         # Frame ins Root-Fenster setzen
 # Fonts / Design-Grundlagen
 # ===================================================================
 # Einheitliche Schrift für bessere Lesbarkeit (Windows: Segoe UI)
-FONT_MAIN = ("Segoe UI", 12)        # Standardtext
-FONT_BIG  = ("Segoe UI", 14, "bold")# Größer/fett, z.B. für Ergebnis & Operatoren
-
-# StringVar: Tkinter Variable, die Widgets automatisch aktualisieren kann
-# -> Wenn result.set(...) aufgerufen wird, aktualisiert sich das Label.
-result = tk.StringVar(value="")
+# Benannte Font-Objekte (statt Tupel): Tk löst die Schrift nur einmal auf
+# und alle Widgets teilen sich dieselbe Font-Ressource.
+# (Font-Objekte brauchen ein existierendes root-Fenster.)
+# Standardtext
+FONT_MAIN = tkfont.Font(family="Segoe UI", size=12)
+# Größer/fett, z.B. für Ergebnis & Operatoren
+FONT_BIG  = tkfont.Font(family="Segoe UI", size=14, weight="bold")
 
 
 # ===================================================================
@@ -134,6 +216,13 @@ entry_b = tk.Entry(frame, font=FONT_MAIN, width=14, justify="right")
 entry_a.grid(row=1, column=0, padx=6, pady=(2, 10))
 entry_b.grid(row=1, column=1, padx=6, pady=(2, 10))
 
+# Gebundene Methoden einmalig merken: calculate() spart sich so bei jedem
+# Klick die Attribut-Suche auf den Widgets.
+_get_a = entry_a.get
+_get_b = entry_b.get
+_delete_a = entry_a.delete          # dasselbe für clear()
+_delete_b = entry_b.delete
+
 
 # ===================================================================
 # Ergebnisanzeige
@@ -150,7 +239,7 @@ tk.Label(frame, text="Ergebnis", font=FONT_MAIN).grid(
 # - width ist hier in Zeichen (nicht Pixel)
 result_label = tk.Label(
     frame,
-    textvariable=result,  # zeigt den Inhalt von result an
+    text="",              # Inhalt wird direkt per configure(text=...) gesetzt
     font=FONT_BIG,
     anchor="e",
     width=30,
@@ -161,6 +250,10 @@ result_label = tk.Label(
 )
 result_label.grid(row=3, column=0, columnspan=2, pady=(2, 12), sticky="we")
 
+# Text direkt am Label setzen (ohne StringVar) -> keine Tcl-Variable mit
+# Trace-Callback dazwischen. Gebundene Methode einmalig merken.
+_set_result = result_label.configure
+
 
 # ===================================================================
 # Buttons (Operatoren + Clear)
@@ -194,7 +287,7 @@ def make_btn(text: str, op: str | None = None, bg: str | None = None) -> tk.Butt
         Der fertig konfigurierte Button.
     """
     # Wenn op gesetzt ist: Klick ruft calculate(op) auf, sonst clear()
-    cmd = (lambda: calculate(op)) if op else clear
+    cmd = partial(calculate, op) if op else clear
 
     return tk.Button(
         btn_frame,
@@ -211,21 +304,46 @@ def make_btn(text: str, op: str | None = None, bg: str | None = None) -> tk.Butt
     )
 
 
-# Operator-Buttons platzieren (Grid in btn_frame)
+# Operator-Buttons als Tabelle: (Beschriftung, Operator, Hintergrundfarbe)
 # Achtung: Für Multiplikation/Division zeigen wir schöne Zeichen (×, ÷),
 # aber übergeben intern '*' bzw. '/' an calculate().
-make_btn("+", "+", bg="#d9ead3").grid(row=0, column=0, padx=5, pady=5)  # grünlich
-make_btn("-", "-", bg="#fce5cd").grid(row=0, column=1, padx=5, pady=5)  # orange
-make_btn("×", "*", bg="#cfe2f3").grid(row=0, column=2, padx=5, pady=5)  # blau
-make_btn("÷", "/", bg="#ead1dc").grid(row=0, column=3, padx=5, pady=5)  # rosa
+_BTNS = (
+    ("+", "+", "#d9ead3"),  # grünlich
+    ("-", "-", "#fce5cd"),  # orange
+    ("×", "*", "#cfe2f3"),  # blau
+    ("÷", "/", "#ead1dc"),  # rosa
+)
+
+# Operator-Buttons platzieren (Grid in btn_frame), Spalte = Position in _BTNS
+for col, (txt, op, bg) in enumerate(_BTNS):
+    make_btn(txt, op, bg=bg).grid(row=0, column=col, padx=5, pady=5)
 
 # Clear-Button über die volle Breite (columnspan=2)
-tk.Button(
-    frame,
-    text="Clear (Esc)",
-    font=FONT_MAIN,
-    command=clear
-).grid(row=5, column=0, columnspan=2, sticky="we", pady=(6, 0))
+# Wird erst bei Bedarf erzeugt (erste ungültige Eingabe oder Escape):
+# Bei korrekten Eingaben braucht man ihn nie -> schnellerer Start.
+_clear_btn: tk.Button | None = None
+
+
+def _ensure_clear_btn() -> None:
+    """
+    Erzeugt den Clear-Button beim ersten Aufruf; danach passiert nichts mehr.
+    """
+    global _clear_btn
+    if _clear_btn is not None:
+        return
+    _clear_btn = tk.Button(
+        frame,
+        text="Clear (Esc)",
+        font=FONT_MAIN,
+        command=clear
+    )
+    _clear_btn.grid(row=5, column=0, columnspan=2, sticky="we", pady=(6, 0))
+
+
+# Platz für die Clear-Zeile trotzdem von Anfang an reservieren, damit das
+# Fenster nicht mitten in der Benutzung wächst (frame wird unten fixiert):
+# Schrifthöhe + 2 x (Innenabstand 1 + Rand 2 + Fokusrahmen 1) + pady oben 6
+frame.grid_rowconfigure(5, minsize=FONT_MAIN.metrics("linespace") + 2 * 4 + 6)
 
 
 # ===================================================================
@@ -233,8 +351,58 @@ tk.Button(
 # ===================================================================
 # Enter rechnet standardmäßig PLUS (kannst du auch ändern)
 # Escape leert die Felder
-root.bind("<Return>", lambda e: calculate("+"))
-root.bind("<Escape>", lambda e: clear())
+
+# Mindestabstand (Sekunden) zwischen zwei Enter-Berechnungen.
+# Hält man Enter gedrückt, feuert das Betriebssystem Auto-Repeat-Events
+# (oft 30+ pro Sekunde) -> wir rechnen höchstens alle 50 ms.
+MIN_INTERVAL = 0.05
+_last_calc_ts = 0.0
+
+
+def _on_return(event: tk.Event) -> None:
+    """
+    Enter-Handler: rechnet PLUS, aber gedrosselt auf MIN_INTERVAL.
+    """
+    global _last_calc_ts
+    now = time.monotonic()
+    if now - _last_calc_ts >= MIN_INTERVAL:
+        _last_calc_ts = now
+        calculate("+")
+
+
+def _on_escape(event: tk.Event) -> None:
+    """
+    Escape-Handler: zeigt (falls nötig) den Clear-Button und leert alles.
+    """
+    _ensure_clear_btn()
+    clear()
+
+
+# Bindung an die Widget-Klassen "Entry" und "Button" statt an das
+# Root-Fenster: Nur diese Widgets können den Tastatur-Fokus bekommen.
+for widget_class in ("Entry", "Button"):
+    root.bind_class(widget_class, "<Return>", _on_return)
+    root.bind_class(widget_class, "<Escape>", _on_escape)
+
+
+# ===================================================================
+# Layout fixieren
+# ===================================================================
+# Größe von frame einmal von Tk ausmessen lassen und dann fest einstellen.
+# Mit grid_propagate(False) richtet sich frame danach nicht mehr nach seinen
+# Kindern -> spätere Änderungen im Inhalt lösen kein erneutes Ausmessen aus.
+# Feste Pixelwerte wären riskant, weil die Größe von der Schrift (und damit
+# vom Betriebssystem) abhängt. Später hinzukommende Widgets brauchen daher
+# vorab reservierten Platz.
+root.update_idletasks()
+frame.configure(width=frame.winfo_reqwidth(), height=frame.winfo_reqheight())
+frame.grid_propagate(False)
+
+# Alle Widgets sind fertig aufgebaut -> Layout einmal berechnen und das
+# Fenster jetzt einmal anzeigen (statt beim Aufbau für jedes Widget neu
+# zu zeichnen).
+root.update_idletasks()
+root.deiconify()
 
 
 # Start: Fokus direkt ins erste Feld, damit man sofort tippen kann